@@ -9,7 +9,8 @@ def check_stabilized(
     device: Basik,
     measurement: str = "wavelength",
     tolerance: float = 1e-3,
-    dt: float = 1.0,
+    dt_min: float = 0.2,
+    dt_max: float = 5.0,
     dt_stable: float = 5.0,
     progress: bool = True,
 ):
@@ -32,17 +33,25 @@ def check_stabilized(
 
     units = {"wavelength": "nm", "frequency": "Ghz"}
     setpoint = getattr(device, f"{measurement}_setpoint")
+    # resolve the property getter once instead of looking it up every poll
+    read = getattr(type(device), measurement).fget
 
     unit = units[measurement]
 
-    # wait to stabilize
-    counter = 0
+    # wait to stabilize; poll quickly right after a setpoint change and back off
+    # once the error stops shrinking
+    dt = dt_min
+    previous_error = None
+    stable_since = None
+    elapsed_stable = 0.0
     with console.status(
         f"Waiting for {measurement} to stabilize", spinner="dots"
     ) as status:
         while True:
-            wl = getattr(device, measurement)
-            within_limits = abs(wl - setpoint) < tolerance
+            wl = read(device)
+            diff = setpoint - wl
+            error = abs(diff)
+            within_limits = error < tolerance
             if within_limits:
                 color = "green"
             else:
@@ -51,19 +60,32 @@ def check_stabilized(
                 status.update(
                     f"Waiting for {measurement} to stabilize\n   set ="
                     f" {setpoint:.4f} {unit}, act = [{color}]{wl:.2f} {unit}[/{color}],"
-                    f" Δ = [{color}]{setpoint - wl:.4f} {unit}[/{color}]"
+                    f" Δ = [{color}]{diff:.4f} {unit}[/{color}]"
                 )
             if within_limits:
-                counter += 1
-                if dt * counter >= dt_stable:
+                if stable_since is None:
+                    stable_since = time.monotonic()
+                elapsed_stable = time.monotonic() - stable_since
+                if elapsed_stable >= dt_stable:
                     break
-            else:
-                counter = 0
+            elif stable_since is not None:
+                # dropped back out of the limits, poll quickly again
+                stable_since = None
+                elapsed_stable = 0.0
+                dt = dt_min
+                # skip the back-off below on this tick, the error just grew
+                previous_error = None
+            if (
+                previous_error is not None
+                and previous_error - error <= 0.01 * previous_error
+            ):
+                dt = min(dt * 1.5, dt_max)
+            previous_error = error
             time.sleep(dt)
         if progress:
             console.print(
                 f"reached setpoint with tolerance {tolerance:.2e} {unit}; stable for "
-                f"{dt*counter} seconds"
+                f"{elapsed_stable:.1f} seconds"
             )
 
 
@@ -89,8 +111,8 @@ if device.wavelength_setpoint != wavelength:
 frequency = device.frequency
 step_size = 10  # GHz
 
-print(f"original frequency = {device.frequency:.4f} GHz")
-print(f"setpoint frequency = {device.frequency + Δfrequency:.4f} GHz")
+print(f"original frequency = {frequency:.4f} GHz")
+print(f"setpoint frequency = {frequency + Δfrequency:.4f} GHz")
 print("==" * 25)
 for _ in range(int(Δfrequency / step_size)):
     device.move_frequency(step_size)
@@ -1,3 +1,6 @@
+import importlib
+from typing import TYPE_CHECKING
+
 from .bits_handling import (
     ModulationWaveform,
     NKTError,
@@ -11,8 +14,39 @@ from .constants_and_enums import (
     ModulationRange,
     ModulationSource,
 )
-from .functions import find_all_devices, find_device_by_name, find_devices_by_names
-from .module import Basik
+
+if TYPE_CHECKING:
+    from .functions import (
+        DeviceSession,
+        clear_scan_cache,
+        find_all_devices,
+        find_device_by_name,
+        find_devices_by_names,
+        query_all,
+    )
+    from .module import Basik
+
+# these load the NKT DLL, so they are only imported on first use
+_lazy_imports = {
+    "Basik": "module",
+    "DeviceSession": "functions",
+    "clear_scan_cache": "functions",
+    "find_all_devices": "functions",
+    "find_device_by_name": "functions",
+    "find_devices_by_names": "functions",
+    "query_all": "functions",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        module = importlib.import_module(f".{_lazy_imports[name]}", __name__)
+        value = getattr(module, name)
+        # later lookups find the name directly and skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ModulationWaveform",
@@ -25,7 +59,10 @@ __all__ = [
     "ModulationRange",
     "ModulationSource",
     "Basik",
+    "DeviceSession",
+    "clear_scan_cache",
     "find_all_devices",
     "find_device_by_name",
     "find_devices_by_names",
+    "query_all",
 ]
@@ -1,16 +1,22 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum, IntEnum
 from typing import Dict, List, Tuple, Union
 
 
 @dataclass
 class BasikState:
+    @classmethod
+    def _field_names(cls) -> Tuple[str, ...]:
+        # cached per subclass on first use, the fields only exist after the
+        # subclass has been processed by @dataclass
+        names = cls.__dict__.get("_names")
+        if names is None:
+            names = tuple(cls.__dataclass_fields__)
+            cls._names = names
+        return names
+
     def to_list_set(self):
-        return [
-            name
-            for name, field in self.__dataclass_fields__.items()
-            if getattr(self, field.name)
-        ]
+        return [name for name in self._field_names() if getattr(self, name)]
 
 
 class StatusBits(IntEnum):
@@ -52,16 +58,25 @@ class ModulationSetupBits(Enum):
 
 
 class Bits:
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
     def get_set_bits(self) -> List:
-        return [i for i in range(self.value.bit_length()) if (self.value >> i & 1)]
+        # only visit the set bits by repeatedly stripping the lowest one
+        value = self.value if self.value else 0
+        bits = []
+        while value:
+            lowest = value & -value
+            bits.append(lowest.bit_length() - 1)
+            value ^= lowest
+        return bits
 
     def set_bit(self, bit: int, bit_value: int) -> None:
-        value = self.value if self.value else 0
-        value = value | (1 << bit) if bit_value else value & ~(1 << bit)
-        self.value = value
+        # clear the bit, then or in the mask if bit_value is truthy (-1 & mask)
+        mask = 1 << bit
+        self.value = ((self.value or 0) & ~mask) | (-bool(bit_value) & mask)
 
     def get_bit(self, bit: int) -> int:
         return self.value >> bit & 1
@@ -86,13 +101,20 @@ class BasikStatus(BasikState):
 
 
 class NKTStatus(Bits):
+    __slots__ = ()
+
+    # bit mask of each dataclass field, in field order so the dataclass can be
+    # constructed positionally; resolved once instead of every call
+    _masks: Tuple[int, ...] = tuple(
+        1 << StatusBits[field.name].value for field in fields(BasikStatus)
+    )
+
     def __init__(self, value: int):
         super().__init__(value)
 
     def get_status(self) -> BasikStatus:
-        return BasikStatus(
-            **dict((en.name, bool(self.get_bit(en.value))) for en in StatusBits)
-        )
+        value = self.value
+        return BasikStatus(*[bool(value & mask) for mask in self._masks])
 
 
 @dataclass
@@ -105,13 +127,18 @@ class BasikError(BasikState):
 
 
 class NKTError(Bits):
+    __slots__ = ()
+
+    _masks: Tuple[int, ...] = tuple(
+        1 << ErrorBits[field.name].value for field in fields(BasikError)
+    )
+
     def __init__(self, value: int):
         super().__init__(value)
 
     def get_errors(self) -> BasikError:
-        return BasikError(
-            **dict((en.name, bool(self.get_bit(en.value))) for en in ErrorBits)
-        )
+        value = self.value
+        return BasikError(*[bool(value & mask) for mask in self._masks])
 
 
 @dataclass
@@ -126,13 +153,18 @@ class BasikSetup(BasikState):
 
 
 class NKTSetup(Bits):
+    __slots__ = ()
+
+    _masks: Tuple[int, ...] = tuple(
+        1 << SetupBits[field.name].value for field in fields(BasikSetup)
+    )
+
     def __init__(self, value: int):
         super().__init__(value)
 
     def get_setup(self) -> BasikSetup:
-        return BasikSetup(
-            **dict((en.name, bool(self.get_bit(en.value))) for en in SetupBits)
-        )
+        value = self.value
+        return BasikSetup(*[bool(value & mask) for mask in self._masks])
 
 
 class ModulationWaveform(IntEnum):
@@ -143,33 +175,29 @@ class ModulationWaveform(IntEnum):
 
 
 class NKTModulationSetup(Bits):
+    __slots__ = ()
+
+    # waveforms and their names indexed by the value of bits 6 and 7
+    _waveforms: Tuple[ModulationWaveform, ...] = tuple(ModulationWaveform)
+    _waveform_names: Tuple[str, ...] = tuple(wf.name for wf in ModulationWaveform)
+
     def __init__(self, value=None):
         super().__init__(value)
 
     def get_setup(self) -> Dict[str, Union[int, str]]:
-        setup: Dict[str, Union[int, str]] = {}
-        for bit in [0, 2, 4]:
-            setup[ModulationSetupBits(bit).name] = self.get_bit(
-                ModulationSetupBits(bit).value
-            )
-
-        # last 2 bits specify modulation waveform
-        setup["MODULATION_WAVEFORM"] = ModulationWaveform(self.value >> 6).name
-        return setup
+        value = self.value
+        return {
+            "AMPLITUDE_MODULATION_FREQUENCY_SELECTOR": value & 1,
+            "AMPLITUDE_MODULATION_WAVEFORM": value >> 2 & 1,
+            "WAVELENGTH_MODULATION_FREQUENCY_SELECTOR": value >> 4 & 1,
+            # bits 6 and 7 specify the modulation waveform
+            "MODULATION_WAVEFORM": self._waveform_names[value >> 6 & 3],
+        }
 
     def get_waveform(self) -> ModulationWaveform:
-        return ModulationWaveform(self.value >> 6)
+        return self._waveforms[self.value >> 6 & 3]
 
     def set_waveform(self, waveform: ModulationWaveform) -> None:
-        # value = self.value if self.value else 0
-        # value = value | (1 << bit) if bit_value else value & ~(1 << bit)
-        # self.value = value
-        wf = waveform.value << 6
-
-        value = self.value if self.value else 0
-        if waveform.value:
-            value = value | wf
-            self.value = value
-        else:
-            self.set_bit(6, 0)
-            self.set_bit(7, 0)
+        # bits 6 and 7 specify the modulation waveform; clear both before
+        # inserting the new waveform
+        self.value = ((self.value or 0) & ~0xC0) | ((waveform.value & 3) << 6)
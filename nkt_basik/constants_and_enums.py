@@ -24,6 +24,7 @@ class ModulationCoupling(Enum):
 
 
 class ModulationSource(Enum):
+    NA = 0
     EXTERNAL = 1
     INTERNAL = 2
     BOTH = 3
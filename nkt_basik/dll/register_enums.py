@@ -1,5 +1,6 @@
 from enum import Enum
 from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from .NKTP_DLL import (
     registerReadAscii,
@@ -146,3 +147,36 @@ class RegUnits(Enum):
     WAVELENGTH_MODULATION_LEVEL = "permille"
     WAVELENGTH_MODULATION_OFFSET = "permille"
     AMPLITUDE_MODULATION_FREQUENCY = "Hz"
+
+
+def _scaling(register: RegLoc) -> Optional[float]:
+    if register.name in RegScaling.__members__:
+        return RegScaling[register.name].value
+    return None
+
+
+def _read_ascii(*args) -> Tuple[int, str]:
+    register_result, value = registerReadAscii(*args)
+    return register_result, value.decode() if register_result == 0 else ""
+
+
+def _reader(register: RegLoc) -> Callable[..., Tuple[int, Any]]:
+    # unwrap the partial so a read calls the DLL function directly
+    reader = RegTypeRead[register.name].value.func
+    # string registers are decoded here so query does not have to check types
+    return _read_ascii if reader is registerReadAscii else reader
+
+
+# register access resolved once at import; maps each register to its DLL read or
+# write function and its scaling (None if the register value is not scaled)
+READ_TABLE: Dict[RegLoc, Tuple[Callable[..., Tuple[int, Any]], Optional[float]]] = {
+    register: (_reader(register), _scaling(register))
+    for register in RegLoc
+    if register.name in RegTypeRead.__members__
+}
+
+WRITE_TABLE: Dict[RegLoc, Tuple[Callable[..., int], Optional[float]]] = {
+    register: (RegTypeWrite[register.name].value.func, _scaling(register))
+    for register in RegLoc
+    if register.name in RegTypeWrite.__members__
+}
@@ -1,56 +1,197 @@
 import logging
-from typing import Dict, Optional, Sequence, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from .dll.NKTP_DLL import (
     DeviceResultTypes,
+    RegisterResultTypes,
     closePorts,
     deviceGetAllTypes,
     getAllPorts,
     getOpenPorts,
     openPorts,
 )
-from .module import Basik
+from .dll.register_enums import READ_TABLE, RegLoc
+from .module import Basik, _port_lock, _port_users
+from .utils import result_name
 
+# seconds for which modules found by a scan are reused, 0 disables the cache;
+# a module renamed within this time is still found under its old name
+SCAN_CACHE_TTL = 0.0
 
-def find_all_devices() -> Optional[Tuple[Tuple[str, int]]]:
-    """
-    Find all connected Basik modules
+# maximum number of ports accessed in parallel by the scans and query_all
+MAX_PORT_WORKERS = 8
+
+_scan_cache: Dict[
+    Optional[Tuple[str, ...]], Tuple[float, Dict[str, Tuple[str, int]]]
+] = {}
+_all_devices_cache: Optional[Tuple[float, Dict[str, List[int]]]] = None
+
+
+def _device_ids(caller: str) -> Dict[str, List[int]]:
+    """Device ids of the modules on each open port. The ports are probed in
+    parallel since each deviceGetAllTypes call blocks on its own port.
+
+    Args:
+        caller (str): prefix for the warning logged for ports that fail
 
     Returns:
-        Optional[Tuple[Tuple[str, int]]]: tuple of tuples with the com port and devID
+        dict: dictionary with a list of device ids for each port
     """
-    openPorts(getAllPorts(), 1, 0)
+    ports = [port for port in getOpenPorts().split(",") if port]
+    if not ports:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_PORT_WORKERS, len(ports))) as executor:
+        results = list(executor.map(deviceGetAllTypes, ports))
 
     devices = {}
-    for port in getOpenPorts().split(","):
-        device_result, device_types = deviceGetAllTypes(port)
+    for port, (device_result, device_types) in zip(ports, results):
         if device_result != 0:
-            _device_result = DeviceResultTypes(device_result).split(":")[-1]
-            logging.warning(f"fin_all_devices: {_device_result}")
+            _device_result = result_name(DeviceResultTypes, device_result)
+            logging.warning("%s: %s", caller, _device_result)
             continue
-        else:
-            devices[port] = [
-                devID for devID in range(len(device_types)) if device_types[devID] != 0
-            ]
-    if len(devices) > 0:
-        return tuple([(port, devID) for port, devID in devices.items()])
-    else:
+        devices[port] = [
+            devID for devID in range(len(device_types)) if device_types[devID] != 0
+        ]
+    return devices
+
+
+def find_all_devices() -> Optional[Tuple[Tuple[str, int]]]:
+    """
+    Find all connected Basik modules. The result of a scan is remembered for
+    SCAN_CACHE_TTL seconds, if set.
+
+    Returns:
+        Optional[Tuple[Tuple[str, int]]]: tuple of tuples with the com port and devID
+    """
+    global _all_devices_cache
+    if (
+        _all_devices_cache is None
+        or not SCAN_CACHE_TTL
+        or time.monotonic() - _all_devices_cache[0] > SCAN_CACHE_TTL
+    ):
+        open_before = _open_ports()
+        _all_devices_cache = (time.monotonic(), _device_ids("find_all_devices"))
+        _close_opened_ports(open_before)
+
+    devices = _all_devices_cache[1]
+    return (
+        tuple((port, devID) for port, devIDs in devices.items() for devID in devIDs)
+        or None
+    )
+
+
+def _read_name(port: str, devID: int) -> Optional[str]:
+    """Read the user modifiable text field of a module on an already opened port
+
+    Args:
+        port (str)  : COM port
+        devID (int) : device id
+
+    Returns:
+        str: module name, or None if the register could not be read
+    """
+    reader, _ = READ_TABLE[RegLoc.NAME]
+    register_result, name = reader(port, devID, RegLoc.NAME.value, -1)
+    if register_result != 0:
+        _register_result = result_name(RegisterResultTypes, register_result)
+        logging.warning("_read_name(%s, %s): %s", port, devID, _register_result)
         return None
+    return name
 
 
-def find_device_by_name(
-    name: str, ports: Optional[Sequence[str]] = None
-) -> Optional[Tuple[str, int]]:
-    """Find Basik module com port and device id by checking the user modifiable
-    text field
+def _read_names(
+    port: str, devIDs: Sequence[int], missing: Optional[Set[str]] = None
+) -> Dict[str, Tuple[str, int]]:
+    """Read the names of all modules on a single, already opened, port
 
     Args:
-        name (str)      : device
-        ports (list)    : list port COM ports to look at, if None tries all
+        port (str)      : COM port
+        devIDs (list)   : device ids of the modules on the port
+        missing (set)   : names still to be found, shared between the ports;
+                            reading stops once it is empty. If None all names
+                            are read.
 
     Returns:
-        tuple: (com, devID) or None if no device that matches found
+        dict: dictionary with the (com, devID) tuple for each module name
+    """
+    names: Dict[str, Tuple[str, int]] = {}
+    for devID in devIDs:
+        if missing is not None and not missing:
+            break
+        name = _read_name(port, devID)
+        if name is not None:
+            names.setdefault(name, (port, devID))
+            if missing is not None:
+                missing.discard(name)
+    return names
+
+
+class DeviceSession:
+    """Keep the COM ports open, and scanned, across several find_device_by_name
+    and find_devices_by_names calls and Basik instances instead of opening (2 to
+    3 s) and closing them for every scan or connection
+
+    Args:
+        ports (list): list port COM ports to look at, if None tries all
+
+    Example:
+        with DeviceSession() as session:
+            seed1 = Basik(*find_device_by_name("seed1", session=session))
+            seed1.emission = True
+            seed1.close()
+            seed2 = find_device_by_name("seed2", session=session)
     """
+
+    def __init__(self, ports: Optional[Sequence[str]] = None):
+        self.ports = ports
+        self._held: List[str] = []
+        self._keep: Set[str] = set()
+
+    def __enter__(self) -> "DeviceSession":
+        open_before = set(_open_ports(self.ports).split(","))
+        # count the session as a user of its ports, like a Basik instance, so a
+        # Basik closed inside the session leaves them open
+        with _port_lock:
+            self._held = [port for port in getOpenPorts().split(",") if port]
+            # ports opened outside of this package are left open on exit
+            self._keep = {
+                port
+                for port in self._held
+                if port in open_before and not _port_users.get(port)
+            }
+            for port in self._held:
+                _port_users[port] = _port_users.get(port, 0) + 1
+        return self
+
+    def __exit__(self, *exc):
+        with _port_lock:
+            ports = []
+            for port in self._held:
+                users = _port_users.get(port, 1) - 1
+                if users > 0:
+                    _port_users[port] = users
+                    continue
+                _port_users.pop(port, None)
+                if port not in self._keep:
+                    ports.append(port)
+            if ports:
+                closePorts(",".join(ports))
+        self._held = []
+
+
+def _open_ports(ports: Optional[Sequence[str]] = None) -> str:
+    """Open the COM ports for a scan
+
+    Args:
+        ports (list): list port COM ports to look at, if None tries all
+
+    Returns:
+        str: the ports that were already open before, for _close_opened_ports
+    """
+    open_before = getOpenPorts()
     # arguments are automode and livemode
     # automode: 0 open port, 1 open and start scanning devIDs
     # livemode: 0 disables continuous monitoring, 1 enable; allows for callbacks
@@ -59,81 +200,173 @@ def find_device_by_name(
         openPorts(getAllPorts(), 1, 0)
     else:
         openPorts(",".join(ports), 1, 0)
+    return open_before
 
-    devices = {}
-    for port in getOpenPorts().split(","):
-        device_result, device_types = deviceGetAllTypes(port)
-        if device_result != 0:
-            _device_result = DeviceResultTypes(device_result).split(":")[-1]
-            logging.warning(f"find_device_by_name({name}): {_device_result}")
-            continue
-        else:
-            devices[port] = [
-                devID for devID in range(len(device_types)) if device_types[devID] != 0
-            ]
 
-    closePorts(getOpenPorts())
+def _close_opened_ports(open_before: str) -> None:
+    """Close the ports opened by a scan, leaving ports that were already open
+    before the scan or that are used by a Basik instance
+
+    Args:
+        open_before (str): comma separated ports open before the scan
+    """
+    keep = set(open_before.split(","))
+    # hold the lock so a Basik connecting meanwhile keeps its port
+    with _port_lock:
+        ports = [
+            port
+            for port in getOpenPorts().split(",")
+            if port and port not in keep and not _port_users.get(port)
+        ]
+        if ports:
+            closePorts(",".join(ports))
+
+
+def _scan_names(
+    ports: Optional[Sequence[str]] = None,
+    session: Optional[DeviceSession] = None,
+    names: Optional[Sequence[str]] = None,
+) -> Dict[str, Tuple[str, int]]:
+    """Scan the COM ports for Basik modules and read the user modifiable text
+    field of each module
+
+    Args:
+        ports (list)    : list port COM ports to look at, if None tries all
+        session (DeviceSession): session with already opened ports, if None the
+                                    ports are opened and closed by the scan
+        names (list)    : stop reading once these names are found, if None the
+                            names of all modules are read
+
+    Returns:
+        dict: dictionary with the (com, devID) tuple for each module name
+    """
+    if session is None:
+        open_before = _open_ports(ports)
+
+    devices = _device_ids(f"_scan_names({ports})")
 
-    for com, devIDs in devices.items():
-        for devID in devIDs:
-            basik = Basik(com, devID)
-            if basik.name == name:
-                basik.close()
-                closePorts(getOpenPorts())
-                return com, devID
-            else:
-                basik.close()
+    # read the names while the ports are still open from the scan instead of
+    # creating a Basik (and reopening the port) for every module; modules on the
+    # same port are read sequentially, different ports are read in parallel
+    devices_by_name: Dict[str, Tuple[str, int]] = {}
+    # set operations are atomic, so the ports can share the names still missing
+    missing = set(names) if names is not None else None
+    if devices:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_PORT_WORKERS, len(devices))
+        ) as executor:
+            # results are merged in port order so duplicate names resolve the
+            # same way as a sequential scan
+            for port_names in executor.map(
+                _read_names, devices.keys(), devices.values(), repeat(missing)
+            ):
+                for name, device in port_names.items():
+                    devices_by_name.setdefault(name, device)
+
+    if session is None:
+        _close_opened_ports(open_before)
+    return devices_by_name
+
+
+def clear_scan_cache() -> None:
+    """Forget the modules found by previous find_all_devices,
+    find_device_by_name and find_devices_by_names calls, e.g. after (un)plugging
+    hardware"""
+    global _all_devices_cache
+    _scan_cache.clear()
+    _all_devices_cache = None
+
+
+def find_device_by_name(
+    name: str,
+    ports: Optional[Sequence[str]] = None,
+    session: Optional[DeviceSession] = None,
+) -> Optional[Tuple[str, int]]:
+    """Find Basik module com port and device id by checking the user modifiable
+    text field
+
+    Args:
+        name (str)      : device
+        ports (list)    : list port COM ports to look at, if None tries all
+        session (DeviceSession): session with already opened ports, ports is
+                                    ignored if supplied
 
-    closePorts(getOpenPorts())
-    return None
+    Returns:
+        tuple: (com, devID) or None if no device that matches found
+    """
+    return find_devices_by_names([name], ports, session)[name]
 
 
 def find_devices_by_names(
-    names: Sequence[str], ports: Optional[Sequence[str]] = None
+    names: Sequence[str],
+    ports: Optional[Sequence[str]] = None,
+    session: Optional[DeviceSession] = None,
 ) -> Dict[str, Optional[Tuple[str, int]]]:
     """Find Basik module com ports and device ids by checking the user
-    modifiable text field for each of the supplied names
+    modifiable text field for each of the supplied names. Modules found by a
+    scan are remembered for SCAN_CACHE_TTL seconds, if set; a name that is not
+    among them always triggers a new scan. Without the cache the scan stops
+    reading names once all names are found.
 
     Args:
         names (list): list with devices names
         ports (list): list port COM ports to look at, if None tries all
+        session (DeviceSession): session with already opened ports, ports is
+                                    ignored if supplied
 
     Returns:
         dict: dictionary with a (com, devID) tuple for each name, or None if
                 device not found
     """
-    # arguments are automode and livemode
-    # automode: 0 open port, 1 open and start scanning devIDs
-    # livemode: 0 disables continuous monitoring, 1 enable; allows for callbacks
-    # takes about 2 to 3 s
-    if not ports:
-        openPorts(getAllPorts(), 1, 0)
-    else:
-        openPorts(",".join(ports), 1, 0)
+    if session is not None:
+        ports = session.ports
+    if not SCAN_CACHE_TTL:
+        # the scan is not reused, so it stops once all names are found
+        devices_by_name = _scan_names(ports, session, names)
+        return {name: devices_by_name.get(name) for name in names}
 
-    devices = {}
-    for port in getOpenPorts().split(","):
-        device_result, device_types = deviceGetAllTypes(port)
-        if device_result != 0:
-            _device_result = DeviceResultTypes(device_result).split(":")[-1]
-            logging.warning(f"find_devices_by_names({names}): {_device_result}")
-            continue
-        else:
-            devices[port] = [
-                devID for devID in range(len(device_types)) if device_types[devID] != 0
-            ]
-
-    closePorts(getOpenPorts())
-
-    devices_by_name: Dict[str, Optional[Tuple[str, int]]] = {
-        name: None for name in names
-    }
-    for com, devIDs in devices.items():
-        for devID in devIDs:
-            basik = Basik(com, devID)
-            if basik.name in names:
-                devices_by_name[basik.name] = (com, devID)
-            basik.close()
-
-    closePorts(getOpenPorts())
-    return devices_by_name
+    key = tuple(ports) if ports else None
+    cached = _scan_cache.get(key)
+    if (
+        cached is None
+        or time.monotonic() - cached[0] > SCAN_CACHE_TTL
+        or not all(name in cached[1] for name in names)
+    ):
+        cached = (time.monotonic(), _scan_names(ports, session))
+        _scan_cache[key] = cached
+    devices_by_name = cached[1]
+    return {name: devices_by_name.get(name) for name in names}
+
+
+def query_all(
+    devices: Sequence[Basik], register: RegLoc, index: int = -1
+) -> List[Optional[Union[int, float, str]]]:
+    """Query the same register on several Basik modules. Modules on the same
+    port are queried one after the other, different ports are queried in
+    parallel.
+
+    Args:
+        devices (list): Basik modules to query
+        register (enum): RegLoc enum containing register locations
+        index (int, optional): register index. Defaults to -1.
+
+    Returns:
+        list: register values, in the order of devices
+    """
+    indices_by_port: Dict[str, List[int]] = {}
+    for idx, device in enumerate(devices):
+        indices_by_port.setdefault(device.port, []).append(idx)
+
+    values: List[Optional[Union[int, float, str]]] = [None] * len(devices)
+
+    def _query_port(indices: List[int]) -> None:
+        for idx in indices:
+            values[idx] = devices[idx].query(register, index)
+
+    if indices_by_port:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_PORT_WORKERS, len(indices_by_port))
+        ) as executor:
+            # consume the results so exceptions of a port are raised here
+            list(executor.map(_query_port, indices_by_port.values()))
+    return values
@@ -1,4 +1,9 @@
-from typing import Optional, Union
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from .bits_handling import (
     BasikError,
@@ -28,8 +33,14 @@ from .dll.NKTP_DLL import (
     deviceRemove,
     openPorts,
 )
-from .dll.register_enums import RegLoc, RegScaling, RegTypeRead, RegTypeWrite
-from .utils import frequency_to_wavelength, wavelength_to_frequency
+from .dll.register_enums import READ_TABLE, WRITE_TABLE, RegLoc
+from .utils import frequency_to_wavelength, result_name, wavelength_to_frequency
+
+# number of Basik instances using each port; the port is only opened by the first
+# and closed by the last one, so modules sharing a port do not close it for each
+# other
+_port_users: Dict[str, int] = {}
+_port_lock = threading.Lock()
 
 
 class DeviceNotFoundError(Exception):
@@ -54,7 +65,15 @@ class Basik:
     Methods:
         _connect()
         query(register, index)
+        query_many(registers, index)
         write(register, value, index)
+        write_async(register, value, index)
+        flush()
+        enable_read_cache(ttl, ttls)
+        clear_read_cache()
+        start_polling(registers, interval)
+        stop_polling()
+        setup_transaction()
         serial_number
         current_mode
         power_mode
@@ -86,9 +105,15 @@ class Basik:
         frequency(frequency)
         frequency_setpoint
         move_frequency(deviation)
+        sweep_frequency(frequencies, dwell)
 
     """
 
+    # modulation source indexed by the (internal << 1) | external SETUP bits
+    _modulation_sources: Tuple[ModulationSource, ...] = tuple(
+        ModulationSource(bits) for bits in range(4)
+    )
+
     def __init__(self, port: str, devID: int):
         """Initialize NKT Basik module
 
@@ -99,6 +124,42 @@ class Basik:
         self.port = port
         self.devID = devID
 
+        # registers that only change when written, remembered after the first
+        # read; write drops the remembered value of the written register
+        self._serial_number: Optional[str] = None
+        self._wavelength_center: Optional[float] = None
+        self._name: Optional[str] = None
+        # setup register bits changed inside setup_transaction and their mask
+        self._setup = 0
+        self._setup_mask = 0
+        # id of the thread inside setup_transaction, its setup changes are
+        # deferred until the block exits
+        self._setup_transaction: Optional[int] = None
+
+        # opt-in read cache, see enable_read_cache
+        self._cache_ttl = 0.0
+        self._cache_ttls: Dict[RegLoc, float] = {}
+        self._cache: Dict[
+            Tuple[RegLoc, int], Tuple[float, Optional[Union[int, float, str]]]
+        ] = {}
+
+        # background polling, see start_polling; the lock serializes DLL access
+        # between the polling thread and the caller
+        self._lock = threading.RLock()
+        self._poll_interval = 0.0
+        self._poll_stop = threading.Event()
+        self._poll_thread: Optional[threading.Thread] = None
+        self._snapshot: Dict[
+            Tuple[RegLoc, int], Tuple[float, Optional[Union[int, float, str]]]
+        ] = {}
+
+        # background writer, see write_async
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._write_errors: List[Exception] = []
+        # set by close, refuses further writes
+        self._closed = False
+
         self._connect()
 
     def __exit__(self, *exc):
@@ -106,25 +167,57 @@ class Basik:
 
     def _connect(self):
         """Connect to NKT basik module"""
-        device_result = openPorts(self.port, 0, 0)
-        if device_result != 0:
-            device_result = DeviceResultTypes(device_result).split(":")[-1]
-            raise DeviceNotFoundError(f"port {self.port}")
+        with _port_lock:
+            if not _port_users.get(self.port):
+                device_result = openPorts(self.port, 0, 0)
+                if device_result != 0:
+                    device_result = result_name(DeviceResultTypes, device_result)
+                    raise DeviceNotFoundError(f"port {self.port}")
+            _port_users[self.port] = _port_users.get(self.port, 0) + 1
 
         device_result = deviceCreate(self.port, self.devID, 1)
         if device_result != 0:
-            device_result = DeviceResultTypes(device_result).split(":")[-1]
+            self._release_port()
+            device_result = result_name(DeviceResultTypes, device_result)
             raise DeviceNotFoundError(f"port {self.port}, devID {self.devID}")
 
+    def _release_port(self) -> int:
+        """Drop this instance from the users of its port and close the port if it
+        was the last one
+
+        Returns:
+            int: closePorts result, 0 if the port is still in use
+        """
+        with _port_lock:
+            users = _port_users.get(self.port, 1) - 1
+            if users > 0:
+                _port_users[self.port] = users
+                return 0
+            _port_users.pop(self.port, None)
+            return closePorts(self.port)
+
     def close(self):
-        ret = deviceRemove(self.port, self.devID)
-        if ret != 0:
-            ret_result = PortResultTypes(ret).split(":")[-1]
-            raise ValueError(f"port {self.port} {ret_result}")
-        ret = closePorts(self.port)
-        if ret != 0:
-            ret_result = PortResultTypes(ret).split(":")[-1]
-            raise ValueError(f"port {self.port} {ret_result}")
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.stop_polling()
+        self._stop_writer()
+        # the device is removed and the port released even if an earlier step
+        # raises; errors of writes queued before closing are raised first
+        try:
+            self.flush()
+        finally:
+            try:
+                ret = deviceRemove(self.port, self.devID)
+                if ret != 0:
+                    ret_result = result_name(DeviceResultTypes, ret)
+                    raise ValueError(f"port {self.port} {ret_result}")
+            finally:
+                ret = self._release_port()
+                if ret != 0:
+                    ret_result = result_name(PortResultTypes, ret)
+                    raise ValueError(f"port {self.port} {ret_result}")
 
     def query(
         self, register: RegLoc, index: int = -1
@@ -139,23 +232,92 @@ class Basik:
             (int, float, str): value of the register. Type depends on the
                                 specified register.
         """
-        register_result, value = RegTypeRead[register.name](
-            self.port, self.devID, register.value, index
-        )
+        if self._poll_thread is not None:
+            polled = self._snapshot.get((register, index))
+            # stale if the polling thread missed a refresh, e.g. on a read error
+            if (
+                polled is not None
+                and time.monotonic() - polled[0] < 2 * self._poll_interval
+            ):
+                return polled[1]
+
+        ttl = self._cache_ttls.get(register, self._cache_ttl)
+        if ttl:
+            cached = self._cache.get((register, index))
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < ttl:
+                return cached[1]
+
+        value = self._read(register, index)
+
+        if ttl:
+            self._cache[(register, index)] = (now, value)
+        return value
+
+    def _read(
+        self, register: RegLoc, index: int = -1
+    ) -> Optional[Union[int, float, str]]:
+        """Read a register from the module, bypassing the polling snapshot and the
+        read cache
+
+        Args:
+            register (enum): RegLoc enum containing register locations
+            index (int, optional): register index. Defaults to -1.
+
+        Returns:
+            (int, float, str): value of the register
+        """
+        reader, scale = READ_TABLE[register]
+        with self._lock:
+            register_result, value = reader(
+                self.port, self.devID, register.value, index
+            )
+        return self._convert(register, index, register_result, value, scale)
+
+    def query_many(
+        self, registers: Sequence[RegLoc], index: int = -1
+    ) -> List[Optional[Union[int, float, str]]]:
+        """Query several registers on a NKT Basik module. All register reads are
+        issued back-to-back before any of the values are converted.
+
+        Args:
+            registers (Sequence[RegLoc]): RegLoc enums containing register locations
+            index (int, optional): register index. Defaults to -1.
+
+        Returns:
+            list: values of the registers, in the order of registers.
+        """
+        tables = [READ_TABLE[register] for register in registers]
+        port, devID = self.port, self.devID
+        with self._lock:
+            raw = [
+                reader(port, devID, register.value, index)
+                for register, (reader, _) in zip(registers, tables)
+            ]
+        return [
+            self._convert(register, index, register_result, value, scale)
+            for register, (register_result, value), (_, scale) in zip(
+                registers, raw, tables
+            )
+        ]
+
+    @staticmethod
+    def _convert(
+        register: RegLoc,
+        index: int,
+        register_result: int,
+        value: Union[int, float, str],
+        scale: Optional[float],
+    ) -> Optional[Union[int, float, str]]:
+        """Check the result of a register read and convert the raw value"""
         if register_result != 0:
-            register_result = RegisterResultTypes(register_result).split(":")[-1]
+            register_result = result_name(RegisterResultTypes, register_result)
             raise NKTRegisterException(
                 f"Basik query({register.name}, {index}): {register_result}"
             )
 
-        if isinstance(value, bytes):
-            value = value.decode()
-
-        try:
-            # rescale value
-            value *= RegScaling[register.name].value
-        except KeyError:
-            pass
+        if scale is not None:
+            value *= scale
         return value
 
     def write(self, register: RegLoc, value: Union[int, float, str], index: int = -1):
@@ -166,30 +328,232 @@ class Basik:
             value (int, float, str): value to write to register
             index (int, optional): register index. Defaults to -1.
         """
-        try:
-            if isinstance(value, (int, float)):
-                value /= RegScaling[register.name].value
-                value = int(value)
-        except KeyError:
-            pass
-        register_result = RegTypeWrite[register.name](
-            self.port, self.devID, register.value, value, index
-        )
+        if self._closed:
+            raise ValueError(f"Basik write({register.name}): closed")
+        self._write(register, value, index)
+
+    def _write(self, register: RegLoc, value: Union[int, float, str], index: int):
+        """Write to a register without checking if the instance is closed, used by
+        the write_async thread to finish the queued writes while closing"""
+        writer, scale = WRITE_TABLE[register]
+        if scale is not None and isinstance(value, (int, float)):
+            value = int(round(value / scale))
+        if self._cache:
+            # list() copies the keys in one step, the polling or write_async
+            # thread may add entries meanwhile
+            for key in [key for key in list(self._cache) if key[0] is register]:
+                self._cache.pop(key, None)
+        # drop values remembered on the instance for the written register
+        if register is RegLoc.NAME:
+            self._name = None
+        elif register is RegLoc.WAVELENGTH_CENTER:
+            self._wavelength_center = None
+        with self._lock:
+            self._snapshot.pop((register, index), None)
+            register_result = writer(
+                self.port, self.devID, register.value, value, index
+            )
         if register_result != 0:
-            register_result = RegisterResultTypes(register_result).split(":")[-1]
+            register_result = result_name(RegisterResultTypes, register_result)
             raise NKTRegisterException(
                 f"Basik write({register.name}, {index}): {register_result}"
             )
 
+    def write_async(
+        self, register: RegLoc, value: Union[int, float, str], index: int = -1
+    ):
+        """Queue a register write and return immediately. The writes are done in
+        order by a background thread; errors are raised by flush.
+
+        Args:
+            register (enum): enum containing register locations
+            value (int, float, str): value to write to register
+            index (int, optional): register index. Defaults to -1.
+        """
+        if register not in WRITE_TABLE:
+            raise ValueError(f"Basik write_async({register.name}): not writable")
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"Basik write_async({register.name}): closed")
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_worker, daemon=True)
+                self._writer.start()
+        self._write_queue.put((register, value, index))
+
+    def flush(self) -> None:
+        """Wait until all writes queued by write_async are done and raise the
+        first error that occurred since the previous flush"""
+        self._write_queue.join()
+        if self._write_errors:
+            errors, self._write_errors = self._write_errors, []
+            raise errors[0]
+
+    def _write_worker(self) -> None:
+        """Write loop run by the thread started in write_async, None stops it"""
+        while True:
+            item = self._write_queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as error:
+                # keep the thread alive, flush raises the error
+                self._write_errors.append(error)
+            finally:
+                self._write_queue.task_done()
+
+    def _stop_writer(self) -> None:
+        """Finish the queued writes and stop the write_async thread"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._write_queue.put(None)
+            writer.join()
+
+    def enable_read_cache(
+        self, ttl: float = 0.05, ttls: Optional[Dict[RegLoc, float]] = None
+    ) -> None:
+        """Serve repeated query calls for the same register from memory for ttl
+        seconds, useful when polling status or telemetry from several places.
+        Writing a register drops its cached value.
+
+        Args:
+            ttl (float, optional): cache lifetime in seconds, 0 disables the
+                                    cache. Defaults to 0.05.
+            ttls (dict, optional): cache lifetime in seconds per register,
+                                    overriding ttl for those registers, e.g.
+                                    {RegLoc.TEMPERATURE: 0.5}. Defaults to None.
+        """
+        self._cache_ttl = ttl
+        self._cache_ttls = dict(ttls) if ttls else {}
+        self._cache.clear()
+
+    def clear_read_cache(self) -> None:
+        """Drop all values held by the read cache"""
+        self._cache.clear()
+
+    def start_polling(self, registers: Sequence[RegLoc], interval: float = 0.1) -> None:
+        """Read registers in a background thread every interval seconds. While
+        polling, query calls for these registers are answered from the latest
+        readout instead of the module.
+
+        Args:
+            registers (Sequence[RegLoc]): RegLoc enums of the registers to poll
+            interval (float, optional): polling interval in seconds.
+                                        Defaults to 0.1.
+        """
+        self.stop_polling()
+        registers = list(registers)
+        self._poll_interval = interval
+        self._poll_stop.clear()
+        self._poll_thread = threading.Thread(
+            target=self._poll, args=(registers, interval), daemon=True
+        )
+        self._poll_thread.start()
+
+    def stop_polling(self) -> None:
+        """Stop the background polling thread started by start_polling"""
+        with self._lock:
+            thread, self._poll_thread = self._poll_thread, None
+        if thread is None:
+            return
+        self._poll_stop.set()
+        thread.join()
+        self._snapshot.clear()
+
+    def _poll(self, registers: List[RegLoc], interval: float) -> None:
+        """Polling loop run by the thread started in start_polling"""
+        while not self._poll_stop.is_set():
+            # hold the lock until the snapshot is updated so a write in between
+            # can not be overwritten by a value read before it
+            with self._lock:
+                try:
+                    values = self.query_many(registers)
+                except NKTRegisterException as error:
+                    logging.warning(
+                        "Basik poll(%s, %s): %s", self.port, self.devID, error
+                    )
+                else:
+                    now = time.monotonic()
+                    for register, value in zip(registers, values):
+                        self._snapshot[(register, -1)] = (now, value)
+            self._poll_stop.wait(interval)
+
+    def _set_setup_bit(self, bit: SetupBits, value: int) -> None:
+        """Read-modify-write a single bit of the setup register
+
+        Args:
+            bit (SetupBits): setup bit to change
+            value (int): new bit value, 0 or 1
+        """
+        mask = 1 << bit
+        self._set_setup_bits(mask, -bool(value) & mask)
+
+    def _set_setup_bits(self, mask: int, bits: int) -> None:
+        """Read-modify-write the bits in mask of the setup register. The register
+        is read from the module for every change, so changes made elsewhere are
+        kept, and only written if the bits change. Inside setup_transaction the
+        bits are only recorded, and written when the block exits.
+
+        Args:
+            mask (int): mask of the setup bits to change
+            bits (int): new values of the bits in mask
+        """
+        with self._lock:
+            if self._setup_transaction == threading.get_ident():
+                self._setup = (self._setup & ~mask) | (bits & mask)
+                self._setup_mask |= mask
+                return
+            setup = self._read(RegLoc.SETUP)
+            target = (setup & ~mask) | (bits & mask)
+            if target != setup:
+                self.write(RegLoc.SETUP, target)
+
+    @contextmanager
+    def setup_transaction(self) -> Iterator[None]:
+        """Combine changes of the setup register bits (mode, modulation source,
+        range and coupling) into a single write when the block exits. The setup
+        getters read the module, so they do not see the pending changes inside
+        the block. Only changes made by the thread running the block are deferred;
+        on exit the changed bits are applied to the current setup register value,
+        so setup writes made meanwhile by other threads are kept. Nothing is
+        written if the block raises an exception.
+
+        Example:
+            with basik.setup_transaction():
+                basik.modulation_source = ModulationSource.INTERNAL
+                basik.modulation_range = ModulationRange.NARROW
+        """
+        # the lock is only held to start and end the transaction, the block
+        # itself may use other threads, e.g. write_async or query_all
+        with self._lock:
+            self._setup = self._setup_mask = 0
+            self._setup_transaction = threading.get_ident()
+        try:
+            yield
+        except BaseException:
+            with self._lock:
+                self._setup_transaction = None
+            raise
+        with self._lock:
+            self._setup_transaction = None
+            mask = self._setup_mask
+            if mask:
+                setup = self._read(RegLoc.SETUP)
+                target = (setup & ~mask) | (self._setup & mask)
+                if target != setup:
+                    self.write(RegLoc.SETUP, target)
+
     @property
-    def serial_number(self):
-        """Module serial number
+    def serial_number(self) -> str:
+        """Module serial number, read once and cached since it does not change
 
         Returns:
             str: serial number
         """
-        serial = self.query(RegLoc.SERIAL_NUMBER)
-        return serial
+        if self._serial_number is None:
+            self._serial_number = self.query(RegLoc.SERIAL_NUMBER)
+        return self._serial_number
 
     @property
     def mode(self) -> LaserMode:
@@ -201,9 +565,8 @@ class Basik:
         Returns:
             Mode: Mode enum (either POWER or CURRENT)
         """
-        setup = NKTSetup(self.query(RegLoc.SETUP))
-        val = setup.get_value(SetupBits.PUMP_OPERATION_CONSTANT_CURRENT)
-        return LaserMode(val)
+        setup = self.query(RegLoc.SETUP)
+        return LaserMode(setup >> SetupBits.PUMP_OPERATION_CONSTANT_CURRENT & 1)
 
     @mode.setter
     def mode(self, mode: LaserMode) -> None:
@@ -215,9 +578,7 @@ class Basik:
         Args:
             mode (Mode): Mode enum (either POWER or CURRENT)
         """
-        setup = NKTSetup(self.query(RegLoc.SETUP))
-        setup.set_value(SetupBits.PUMP_OPERATION_CONSTANT_CURRENT, mode.value)
-        self.write(RegLoc.SETUP, setup.value)
+        self._set_setup_bit(SetupBits.PUMP_OPERATION_CONSTANT_CURRENT, mode.value)
 
     def set_current_mode(self):
         """
@@ -256,13 +617,15 @@ class Basik:
 
     @property
     def wavelength_center(self) -> float:
-        """Get the device center wavelength in nm
+        """Get the device center wavelength in nm, read once and cached since it is
+        a fixed module calibration
 
         Returns:
             float: center wavelength in nm
         """
-        center = self.query(RegLoc.WAVELENGTH_CENTER)
-        return center
+        if self._wavelength_center is None:
+            self._wavelength_center = self.query(RegLoc.WAVELENGTH_CENTER)
+        return self._wavelength_center
 
     @property
     def wavelength_offset(self) -> float:
@@ -322,7 +685,16 @@ class Basik:
         Args:
             wavelength (int): wavelenght offset in nm
         """
-        center = self.wavelength_center
+        self._set_wavelength_with_center(wavelength, self.wavelength_center)
+
+    def _set_wavelength_with_center(self, wavelength: float, center: float) -> None:
+        """Set the device wavelength setpoint in nm relative to a known center
+        wavelength
+
+        Args:
+            wavelength (float): wavelength setpoint in nm
+            center (float): center wavelength in nm
+        """
         offset = wavelength - center
         offset *= 1e3  # convert to pm
         self.write(RegLoc.WAVELENGTH_OFFSET, offset)
@@ -344,8 +716,7 @@ class Basik:
         Returns:
             bool: True = on, False = off
         """
-        emission = self.query(RegLoc.EMISSION)
-        return bool(emission)
+        return self.query(RegLoc.EMISSION) != 0
 
     @emission.setter
     def emission(self, enable: bool) -> None:
@@ -368,13 +739,14 @@ class Basik:
 
     @property
     def name(self) -> str:
-        """Module name
+        """Module name, cached after the first read and updated by the setter
 
         Returns:
             string: module name
         """
-        name = self.query(RegLoc.NAME)
-        return name
+        if self._name is None:
+            self._name = self.query(RegLoc.NAME)
+        return self._name
 
     @name.setter
     def name(self, name: str) -> None:
@@ -469,7 +841,7 @@ class Basik:
         Returns:
             bool: True = enabled, False = disabled
         """
-        return bool(self.query(RegLoc.WAVELENGTH_MODULATION))
+        return self.query(RegLoc.WAVELENGTH_MODULATION) != 0
 
     @modulation.setter
     def modulation(self, enable: bool) -> None:
@@ -488,10 +860,13 @@ class Basik:
         Returns:
             ModulationSource: ModulationSource enum; NA, EXTERNAL, INTERNAL, BOTH
         """
-        setup = NKTSetup(int(self.query(RegLoc.SETUP)))
-        internal = setup.get_value(SetupBits.INTERNAL_WAVELENGTH_MODULATION)
-        external = setup.get_value(SetupBits.EXTERNAL_WAVELENGTH_MODULATION)
-        return ModulationSource(external + (internal << 1))
+        return self._modulation_source(self.query(RegLoc.SETUP))
+
+    @staticmethod
+    def _modulation_source(setup: int) -> ModulationSource:
+        internal = setup >> SetupBits.INTERNAL_WAVELENGTH_MODULATION & 1
+        external = setup >> SetupBits.EXTERNAL_WAVELENGTH_MODULATION & 1
+        return Basik._modulation_sources[external | internal << 1]
 
     @modulation_source.setter
     def modulation_source(self, source: ModulationSource) -> None:
@@ -501,12 +876,12 @@ class Basik:
         Args:
             source (ModulationSource): ModulationSource enum; EXTERNAL, INTERNAL, BOTH
         """
-        setup = NKTSetup(self.query(RegLoc.SETUP))
-        internal = source.value & 2
-        external = source.value & 1
-        setup.set_value(SetupBits.INTERNAL_WAVELENGTH_MODULATION, internal)
-        setup.set_value(SetupBits.EXTERNAL_WAVELENGTH_MODULATION, external)
-        self.write(RegLoc.SETUP, setup.value)
+        internal = 1 << SetupBits.INTERNAL_WAVELENGTH_MODULATION
+        external = 1 << SetupBits.EXTERNAL_WAVELENGTH_MODULATION
+        self._set_setup_bits(
+            internal | external,
+            (-bool(source.value & 2) & internal) | (-bool(source.value & 1) & external),
+        )
 
     @property
     def modulation_range(self) -> ModulationRange:
@@ -515,8 +890,11 @@ class Basik:
         Returns:
             ModulationRange: WIDE or NARROW modulation range
         """
-        setup = NKTSetup(self.query(RegLoc.SETUP))
-        return ModulationRange(setup.get_value(SetupBits.NARROW_WAVELENGTH_MODULATION))
+        return self._modulation_range(self.query(RegLoc.SETUP))
+
+    @staticmethod
+    def _modulation_range(setup: int) -> ModulationRange:
+        return ModulationRange(setup >> SetupBits.NARROW_WAVELENGTH_MODULATION & 1)
 
     @modulation_range.setter
     def modulation_range(self, modulation_range: ModulationRange) -> None:
@@ -525,11 +903,9 @@ class Basik:
         Args:
             modulation_range (ModulationRange): WIDE or NARROW modulation range
         """
-
-        setup = NKTModulationSetup(self.query(RegLoc.MODULATION_SETUP))
-        setup.set_value(SetupBits.NARROW_WAVELENGTH_MODULATION, modulation_range.value)
-
-        self.write(RegLoc.SETUP, setup.value)
+        self._set_setup_bit(
+            SetupBits.NARROW_WAVELENGTH_MODULATION, modulation_range.value
+        )
 
     @property
     def modulation_frequency(self) -> float:
@@ -580,8 +956,11 @@ class Basik:
         Returns:
             Coupling: Enum with AC (0) or DC (1)
         """
-        setup = NKTSetup(self.query(RegLoc.SETUP))
-        return ModulationCoupling(setup.get_value(SetupBits.WAVELENGTH_MODULATION_DC))
+        return self._modulation_coupling(self.query(RegLoc.SETUP))
+
+    @staticmethod
+    def _modulation_coupling(setup: int) -> ModulationCoupling:
+        return ModulationCoupling(setup >> SetupBits.WAVELENGTH_MODULATION_DC & 1)
 
     @modulation_coupling.setter
     def modulation_coupling(self, coupling: ModulationCoupling):
@@ -591,9 +970,7 @@ class Basik:
         Args:
             coupling (Coupling): Enum with AC (0) or DC (1)
         """
-        setup = NKTSetup(self.query(RegLoc.SETUP))
-        setup.set_value(SetupBits.WAVELENGTH_MODULATION_DC, coupling.value)
-        self.write(RegLoc.SETUP, setup.value)
+        self._set_setup_bit(SetupBits.WAVELENGTH_MODULATION_DC, coupling.value)
 
     @property
     def modulation_waveform(self) -> ModulationWaveform:
@@ -614,15 +991,25 @@ class Basik:
 
     @property
     def wavelength_modulation(self) -> WavelengthModulation:
+        # range, source and coupling share the setup register, read it only once
+        state, amplitude, offset, setup, modulation_setup = self.query_many(
+            [
+                RegLoc.WAVELENGTH_MODULATION,
+                RegLoc.WAVELENGTH_MODULATION_LEVEL,
+                RegLoc.WAVELENGTH_MODULATION_OFFSET,
+                RegLoc.SETUP,
+                RegLoc.MODULATION_SETUP,
+            ]
+        )
         return WavelengthModulation(
-            self.modulation,
+            state != 0,
             self.modulation_frequency,
-            self.modulation_amplitude,
-            self.modulation_offset,
-            self.modulation_range,
-            self.modulation_source,
-            self.modulation_waveform,
-            self.modulation_coupling,
+            amplitude,
+            offset,
+            self._modulation_range(setup),
+            self._modulation_source(setup),
+            NKTModulationSetup(modulation_setup).get_waveform(),
+            self._modulation_coupling(setup),
         )
 
     #############################################
@@ -666,7 +1053,27 @@ class Basik:
         Args:
             deviation (float): frequency deviation in GHz
         """
-        frequency = self.frequency_setpoint
-        self.wavelength_setpoint = round(
-            frequency_to_wavelength(frequency + deviation), 3
+        center = self.wavelength_center
+        offset = self.wavelength_offset / 1e3
+        frequency = wavelength_to_frequency(center + offset)
+        self._set_wavelength_with_center(
+            round(frequency_to_wavelength(frequency + deviation), 3), center
         )
+
+    def sweep_frequency(self, frequencies: Sequence[float], dwell: float) -> None:
+        """Step the module frequency through a sequence of frequencies in GHz. All
+        wavelength offsets are computed before the first step, so only the register
+        writes and the dwell time remain inside the loop.
+
+        Args:
+            frequencies (Sequence[float]): frequencies in GHz
+            dwell (float): time to wait after each step in seconds
+        """
+        center = self.wavelength_center
+        offsets = [
+            (round(frequency_to_wavelength(frequency), 3) - center) * 1e3
+            for frequency in frequencies
+        ]
+        for offset in offsets:
+            self.write(RegLoc.WAVELENGTH_OFFSET, offset)
+            time.sleep(dwell)
@@ -1,5 +1,11 @@
+from functools import lru_cache
+from typing import Callable
+
 from .constants_and_enums import physicalConstants
 
+# speed of light in m/s; c / wavelength in nm gives the frequency in GHz
+C = physicalConstants.c.value
+
 
 def wavelength_to_frequency(wavelength: float) -> float:
     """
@@ -11,7 +17,7 @@ def wavelength_to_frequency(wavelength: float) -> float:
     Returns:
         float: frequency in GHz
     """
-    return physicalConstants.c.value / wavelength
+    return C / wavelength
 
 
 def frequency_to_wavelength(frequency: float) -> float:
@@ -24,4 +30,19 @@ def frequency_to_wavelength(frequency: float) -> float:
     Returns:
         float: wavelength in nm
     """
-    return physicalConstants.c.value / frequency
+    return C / frequency
+
+
+@lru_cache(maxsize=None)
+def result_name(result_types: Callable[[int], str], result: int) -> str:
+    """
+    Name of an NKT DLL result code, e.g. RegResultTimeout, cached per code
+
+    Args:
+        result_types (Callable): DLL result lookup, e.g. RegisterResultTypes
+        result (int): result code returned by the DLL
+
+    Returns:
+        str: name of the result code
+    """
+    return result_types(result).split(":")[-1]